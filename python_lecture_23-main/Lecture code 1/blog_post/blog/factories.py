@@ -1,11 +1,17 @@
 import factory
-import random
 
 from factory import Faker, SubFactory, post_generation
+from factory.random import randgen, reseed_random
 from blog.models import BlogPost, Author
 from user.models import CustomUser
 from django.core.files.base import ContentFile
 
+# Seed factory_boy and Faker once so generated data is reproducible between runs
+reseed_random(12345)
+
+_BLOG_DOC_BYTES = b"Sample blog post document."
+_CATEGORY_CHOICES = (1, 2, 3)
+
 
 class CustomUserFactory(factory.django.DjangoModelFactory):
     email = Faker("email")
@@ -31,7 +37,7 @@ class BlogPostFactory(factory.django.DjangoModelFactory):
     published = Faker("boolean", chance_of_getting_true=70)
     archived = Faker("boolean", chance_of_getting_true=10)
     website = Faker("url")
-    category = factory.LazyFunction(lambda: random.choice([1, 2, 3]))
+    category = factory.LazyFunction(lambda: randgen.choice(_CATEGORY_CHOICES))
     order = factory.Sequence(lambda n: n)
 
     class Meta:
@@ -40,8 +46,7 @@ class BlogPostFactory(factory.django.DjangoModelFactory):
     @factory.lazy_attribute
     def document(self):
         # Creates a fake file-like object (optional)
-        file_content = b"Sample blog post document."
-        return ContentFile(file_content, f"blog_doc_{self.title.replace(' ', '_')}.txt")
+        return ContentFile(_BLOG_DOC_BYTES, f"blog_doc_{self.title.replace(' ', '_')}.txt")
 
     @post_generation
     def authors(self, create, extracted, **kwargs):
@@ -49,7 +54,25 @@ class BlogPostFactory(factory.django.DjangoModelFactory):
         if not create:
             return
         if extracted:
-            for author in extracted:
-                self.authors.add(author)
+            self.authors.add(*extracted)
         else:
             self.authors.add(AuthorFactory())
+
+    @classmethod
+    def bulk_create_with_authors(cls, n, **kwargs):
+        """Create n posts, each with its own owner and author, using bulk inserts."""
+        owners = CustomUser.objects.bulk_create(CustomUserFactory.build_batch(n))
+        authors = Author.objects.bulk_create(AuthorFactory.build_batch(n))
+        posts = BlogPost.objects.bulk_create([cls.build(owner=owner, **kwargs) for owner in owners])
+        BlogPost.authors.through.objects.bulk_create([
+            BlogPost.authors.through(blogpost_id=post.id, author_id=author.id)
+            for post, author in zip(posts, authors)
+        ])
+        return posts
+
+
+class FastBlogPostFactory(BlogPostFactory):
+    """BlogPostFactory with cheap sequential text for tests that don't check Faker output."""
+    title = factory.Sequence(lambda n: f"t{n}")
+    text = factory.Sequence(lambda n: f"x{n}")
+    website = factory.Sequence(lambda n: f"http://e/{n}")
@@ -1,6 +1,6 @@
 from datetime import date
-from django.test import TestCase
-from rest_framework.test import APIClient
+from django.test import SimpleTestCase, TestCase
+from rest_framework.test import APITestCase
 from rest_framework import status
 
 from blog.models import Author
@@ -16,20 +16,22 @@ class AuthorModelTest(TestCase):
         self.assertIsInstance(author.age, int)
         self.assertGreater(author.age, 0)
 
+
+class AuthorStringRepresentationTest(SimpleTestCase):
     def test_string_representation(self):
         author = Author(first_name='Ana', last_name='Smith')
         self.assertEqual(str(author), 'Ana Smith')
 
 
-class AuthorAPITest(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-        self.author1 = Author.objects.create(first_name="Mariam", last_name="Kipshidze")
-        self.author2 = Author.objects.create(first_name="Ana", last_name="Smith")
+class AuthorAPITest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author1 = Author.objects.create(first_name="Mariam", last_name="Kipshidze")
+        cls.author2 = Author.objects.create(first_name="Ana", last_name="Smith")
 
     def test_list_authors(self):
         response = self.client.get('/blog/author/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        names = [item['first_name'] for item in response.data['results']]
-        self.assertIn("Mariam", names)
-        self.assertIn("Ana", names)
+        results = response.data['results']
+        self.assertTrue(any(item['first_name'] == "Mariam" for item in results))
+        self.assertTrue(any(item['first_name'] == "Ana" for item in results))
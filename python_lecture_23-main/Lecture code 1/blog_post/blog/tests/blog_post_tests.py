@@ -1,44 +1,48 @@
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import APITestCase
 
-from blog.factories import BlogPostFactory, AuthorFactory
+from blog.factories import BlogPostFactory, AuthorFactory, FastBlogPostFactory
 from blog.models import BlogPost, Author
 from user.models import CustomUser
 
 
-class BlogPostModelTest(TestCase):
+class BlogPostModelTest(SimpleTestCase):
     def test_blogpost_str_method(self):
         post = BlogPost(title='My First Post', text='Hello world!')
         self.assertEqual(str(post), 'My First Post')
 
 
-class BlogPostViewSetTest(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class BlogPostViewSetTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
         # Create test user
-        self.user = CustomUser.objects.create_user(
+        cls.user = CustomUser.objects.create_user(
             email='admin@example.com',
-            password='pass'
+            password='pass',
+            is_staff=True
         )
-        self.user.is_staff = True
-        self.user.save()
 
         # Create authors
-        self.author = Author.objects.create(first_name="Mariam", last_name="Kipshidze")
+        cls.author = Author.objects.create(first_name="Mariam", last_name="Kipshidze")
 
         # Create blog posts
-        self.post1 = BlogPost.objects.create(title="Published Post", text="Content 1",
-                                             active=True, published=True, owner=self.user)
-        self.post2 = BlogPost.objects.create(title="Unpublished Post", text="Content 2",
-                                             active=True, published=False, owner=self.user)
-        self.post1.authors.add(self.author)
+        cls.post1, cls.post2 = BlogPost.objects.bulk_create([
+            BlogPost(title="Published Post", text="Content 1",
+                     active=True, published=True, owner=cls.user),
+            BlogPost(title="Unpublished Post", text="Content 2",
+                     active=True, published=False, owner=cls.user),
+        ])
+        BlogPost.authors.through.objects.bulk_create([
+            BlogPost.authors.through(blogpost_id=cls.post1.id, author_id=cls.author.id),
+        ], ignore_conflicts=True)
 
     def test_list_published_posts(self):
         url = reverse('blogpost-list')
-        response = self.client.get(url, format='json')
+        with self.assertNumQueries(4):
+            response = self.client.get(url, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         results = response.data['results']['results']
@@ -46,13 +50,13 @@ class BlogPostViewSetTest(TestCase):
 
         self.assertEqual(len(results), 2)
 
-        titles = [item['title'] for item in results]
-        self.assertIn("Published Post", titles)
-        self.assertIn("Unpublished Post", titles)
+        self.assertTrue(any(item['title'] == "Published Post" for item in results))
+        self.assertTrue(any(item['title'] == "Unpublished Post" for item in results))
 
     def test_retrieve_blog_post_detail(self):
         url = reverse('blogpost-detail', kwargs={'pk': self.post1.id})
-        response = self.client.get(url, format='json')
+        with self.assertNumQueries(1):
+            response = self.client.get(url, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['title'], "Published Post")
         self.assertEqual(response.data['text'], "Content 1")
@@ -82,7 +86,7 @@ class BlogPostViewSetTest(TestCase):
         data = {"title": "Updated Title"}
         response = self.client.patch(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.post1.refresh_from_db()
+        self.post1.refresh_from_db(fields=["title"])
         self.assertEqual(self.post1.title, "Updated Title")
 
     def test_destroy_blog_post(self):
@@ -90,7 +94,7 @@ class BlogPostViewSetTest(TestCase):
         url = reverse('blogpost-detail', kwargs={'pk': self.post1.id})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        self.post1.refresh_from_db()
+        self.post1.refresh_from_db(fields=["deleted"])
         self.assertTrue(self.post1.deleted)
 
     def test_publish_blog_post_action(self):
@@ -98,7 +102,7 @@ class BlogPostViewSetTest(TestCase):
         url = reverse('blogpost-publish', kwargs={'pk': self.post2.id})
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.post2.refresh_from_db()
+        self.post2.refresh_from_db(fields=["published"])
         self.assertTrue(self.post2.published)
 
     def test_archive_blog_post_action(self):
@@ -106,7 +110,7 @@ class BlogPostViewSetTest(TestCase):
         url = reverse('blogpost-archive', kwargs={'pk': self.post1.id})
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.post1.refresh_from_db()
+        self.post1.refresh_from_db(fields=["archived"])
         self.assertTrue(self.post1.archived)
 
     def test_not_published_list_action(self):
@@ -122,7 +126,7 @@ class BlogPostViewSetTest(TestCase):
 class BlogPostFactoryTests(TestCase):
     def test_blog_post_creation(self):
         """Basic creation test — ensure factory creates an active post."""
-        post = BlogPostFactory()
+        post = FastBlogPostFactory()
         self.assertTrue(post.active)
         self.assertIsInstance(post, BlogPost)
         self.assertIsNotNone(post.title)
@@ -136,8 +140,7 @@ class BlogPostFactoryTests(TestCase):
 
     def test_blog_post_with_authors(self):
         """Ensure author(s) are correctly assigned."""
-        author1 = AuthorFactory()
-        author2 = AuthorFactory()
+        author1, author2 = AuthorFactory.create_batch(2)
         post = BlogPostFactory(authors=[author1, author2])
 
         self.assertEqual(post.authors.count(), 2)
@@ -154,7 +157,6 @@ class BlogPostFactoryTests(TestCase):
         """Ensure document file is correctly created."""
         post = BlogPostFactory()
         self.assertTrue(post.document.name.startswith("blog_document/blog_doc_"))
-        self.assertTrue(post.document.name.startswith("blog_document/blog_doc_"))
         self.assertTrue(post.document.name.endswith(".txt"))
         self.assertTrue(post.document.size > 0)
 
@@ -165,10 +167,18 @@ class BlogPostFactoryTests(TestCase):
 
     def test_blog_post_order_is_sequential(self):
         """Order should increase with each new factory instance."""
-        p1 = BlogPostFactory()
-        p2 = BlogPostFactory()
+        p1, p2 = FastBlogPostFactory.bulk_create_with_authors(2)
         self.assertTrue(p2.order > p1.order)
 
+    def test_bulk_create_with_authors(self):
+        """Bulk helper should save every post with an owner and one author."""
+        posts = BlogPostFactory.bulk_create_with_authors(3)
+        self.assertEqual(BlogPost.objects.count(), 3)
+        for post in posts:
+            self.assertIsNotNone(post.pk)
+            self.assertIsInstance(post.owner, CustomUser)
+            self.assertEqual(post.authors.count(), 1)
+
     def test_blog_post_website_field(self):
         """Website field should contain a valid-looking URL."""
         post = BlogPostFactory()
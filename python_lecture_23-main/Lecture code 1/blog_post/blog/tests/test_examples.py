@@ -1,6 +1,6 @@
-from django.test import TestCase, Client
+from django.test import SimpleTestCase, TestCase, Client
 
-class SimpleTest(TestCase):
+class SimpleTest(SimpleTestCase):
     def test_addition(self):
         self.assertEqual(1 + 1, 2)
 
@@ -25,7 +25,7 @@ from blog.serializers import (
 
 class BlogPostListViewSet(mixins.ListModelMixin,
                          viewsets.GenericViewSet):
-    queryset = BlogPost.objects.filter(deleted=False)
+    queryset = BlogPost.objects.filter(deleted=False).select_related('banner_image')
     serializer_class = BlogPostListSerializer
     pagination_class = BlogPostCursorPagination
 
@@ -46,7 +46,7 @@ class BlogPostCreateViewSet(mixins.CreateModelMixin,
 
 class BlogPostDetailViewSet(mixins.RetrieveModelMixin,
                            viewsets.GenericViewSet):
-    queryset = BlogPost.objects.filter(deleted=False)
+    queryset = BlogPost.objects.filter(deleted=False).select_related('banner_image')
     serializer_class = BlogPostDetailSerializer
 
 
@@ -65,7 +65,7 @@ class BlogPostDeleteViewSet(mixins.DestroyModelMixin,
 
 
 class BlogPostViewSet(viewsets.ModelViewSet):
-    queryset = BlogPost.objects.filter(deleted=False)
+    queryset = BlogPost.objects.filter(deleted=False).select_related('owner', 'banner_image')
     pagination_class = BlogPostPagination
     filterset_class = BlogPostFilter
 
@@ -1,11 +1,28 @@
+import io
+
 import factory
 from factory import fuzzy
+from django.core.files.base import ContentFile
 from django.utils import timezone
+from PIL import Image
 from blog.models import BlogPost, BlogPostImage
 from user.models import CustomUser
 from blog.models import Author
 
 
+def _make_test_image_bytes():
+    buffer = io.BytesIO()
+    Image.new('RGB', (100, 100), 'blue').save(buffer, 'JPEG')
+    return buffer.getvalue()
+
+
+# Rendered once so every BlogPostImageFactory call reuses the same bytes
+_TEST_IMAGE_BYTES = _make_test_image_bytes()
+
+# Seed factory_boy and Faker once so generated data is reproducible between runs
+factory.random.reseed_random(12345)
+
+
 class CustomUserFactory(factory.django.DjangoModelFactory):
     full_name = factory.Faker("user_name")
     email = factory.Faker("email")
@@ -45,18 +62,23 @@ class BlogPostFactory(factory.django.DjangoModelFactory):
         if not create:
             return
         if extracted:
-            for author in extracted:
-                self.authors.add(author)
+            self.authors.add(*extracted)
         else:
             # create 1–3 random authors
             authors = AuthorFactory.create_batch(factory.random.randgen.randint(1, 3))
-            for author in authors:
-                self.authors.add(author)
+            self.authors.add(*authors)
+
+
+# Skips the get-or-create SELECT on title; use when tests don't reuse titles
+class BlogPostFactoryBulk(BlogPostFactory):
+    class Meta:
+        model = BlogPost
+        django_get_or_create = ()
 
 
 class BlogPostImageFactory(factory.django.DjangoModelFactory):
     blog_post = factory.SubFactory(BlogPostFactory)
-    image = factory.django.ImageField(filename='test_image.jpg')
+    image = factory.LazyFunction(lambda: ContentFile(_TEST_IMAGE_BYTES, 'test_image.jpg'))
 
     class Meta:
         model = BlogPostImage
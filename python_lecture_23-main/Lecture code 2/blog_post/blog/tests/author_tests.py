@@ -1,5 +1,5 @@
 from datetime import date
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from blog.models import Author
 
 class AuthorModelTest(TestCase):
@@ -12,6 +12,8 @@ class AuthorModelTest(TestCase):
         self.assertIsInstance(author.age, int)
         self.assertGreater(author.age, 0)
 
+
+class AuthorStringRepresentationTest(SimpleTestCase):
     def test_string_representation(self):
         author = Author(first_name='Ana', last_name='Smith')
         self.assertEqual(str(author), 'Ana - Smith')
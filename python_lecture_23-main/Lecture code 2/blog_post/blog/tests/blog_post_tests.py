@@ -1,48 +1,58 @@
 from unittest.mock import MagicMock
 
 from django.core.exceptions import ValidationError
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APIClient
-
-from blog.factories import BlogPostFactory, CustomUserFactory, AuthorFactory, BlogPostImageFactory
+from rest_framework.test import APITestCase
+
+from blog.factories import (
+    BlogPostFactory,
+    BlogPostFactoryBulk,
+    CustomUserFactory,
+    AuthorFactory,
+    BlogPostImageFactory
+)
 from user.models import CustomUser
 from blog.models import BlogPost, Author, BlogPostImage
 
 
-class BlogPostModelTest(TestCase):
+class BlogPostModelTest(SimpleTestCase):
     def test_blogpost_str_method(self):
         post = BlogPost(title='My First Post', text='Hello world!')
         self.assertEqual(str(post), 'My First Post')
 
 
-class BlogPostViewSetTest(TestCase):
-    def setUp(self):
-        self.client = APIClient()
-
+@override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+class BlogPostViewSetTest(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
         # Create test user
-        self.user = CustomUser.objects.create_user(
+        cls.user = CustomUser.objects.create_user(
             email='admin@example.com',
-            password='pass'
+            password='pass',
+            is_staff=True
         )
-        self.user.is_staff = True
-        self.user.save()
 
         # Create authors
-        self.author = Author.objects.create(first_name="Mariam", last_name="Kipshidze")
+        cls.author = Author.objects.create(first_name="Mariam", last_name="Kipshidze")
 
         # Create blog posts
-        self.post1 = BlogPost.objects.create(title="Published Post", text="Content 1",
-                                             is_active=True, published=True, owner=self.user)
-        self.post2 = BlogPost.objects.create(title="Unpublished Post", text="Content 2",
-                                             is_active=True, published=False, owner=self.user)
-        self.post1.authors.add(self.author)
+        cls.post1, cls.post2 = BlogPost.objects.bulk_create([
+            BlogPost(title="Published Post", text="Content 1",
+                     is_active=True, published=True, owner=cls.user),
+            BlogPost(title="Unpublished Post", text="Content 2",
+                     is_active=True, published=False, owner=cls.user),
+        ])
+        BlogPost.authors.through.objects.bulk_create([
+            BlogPost.authors.through(blogpost_id=cls.post1.id, author_id=cls.author.id),
+        ], ignore_conflicts=True)
 
     def test_list_not_deleted_posts(self):
         url = reverse('blogpost-list')
-        response = self.client.get(url, format='json')
+        with self.assertNumQueries(4):
+            response = self.client.get(url, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         if 'results' in response.data:
@@ -58,13 +68,13 @@ class BlogPostViewSetTest(TestCase):
         self.assertEqual(len(results), 2)
 
         # Check titles
-        titles = [item['title'] for item in results]
-        self.assertIn("Published Post", titles)
-        self.assertIn("Unpublished Post", titles)
+        self.assertTrue(any(item['title'] == "Published Post" for item in results))
+        self.assertTrue(any(item['title'] == "Unpublished Post" for item in results))
 
     def test_retrieve_blog_post_detail(self):
         url = reverse('blogpost-detail', kwargs={'pk': self.post1.id})
-        response = self.client.get(url, format='json')
+        with self.assertNumQueries(2):
+            response = self.client.get(url, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['title'], "Published Post")
         self.assertEqual(response.data['text'], "Content 1")
@@ -91,7 +101,7 @@ class BlogPostViewSetTest(TestCase):
         data = {"title": "Updated Title"}
         response = self.client.patch(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.post1.refresh_from_db()
+        self.post1.refresh_from_db(fields=["title"])
         self.assertEqual(self.post1.title, "Updated Title")
 
     def test_destroy_blog_post(self):
@@ -99,7 +109,7 @@ class BlogPostViewSetTest(TestCase):
         url = reverse('blogpost-detail', kwargs={'pk': self.post1.id})
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        self.post1.refresh_from_db()
+        self.post1.refresh_from_db(fields=["deleted"])
         self.assertTrue(self.post1.deleted)
 
     def test_publish_blog_post_action(self):
@@ -107,7 +117,7 @@ class BlogPostViewSetTest(TestCase):
         url = reverse('blogpost-publish', kwargs={'pk': self.post2.id})
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.post2.refresh_from_db()
+        self.post2.refresh_from_db(fields=["published"])
         self.assertTrue(self.post2.published)
 
     def test_archive_blog_post_action(self):
@@ -115,7 +125,7 @@ class BlogPostViewSetTest(TestCase):
         url = reverse('blogpost-archive', kwargs={'pk': self.post1.id})
         response = self.client.post(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.post1.refresh_from_db()
+        self.post1.refresh_from_db(fields=["archived"])
         self.assertTrue(self.post1.archived)
 
     def test_published_list_action(self):
@@ -124,7 +134,8 @@ class BlogPostViewSetTest(TestCase):
 
         # Use the standard list endpoint
         url = reverse('blogpost-published-posts')
-        response = self.client.get(url, format='json')
+        with self.assertNumQueries(2):
+            response = self.client.get(url, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # Only check by titles (since 'published' is not included in serializer)
@@ -135,11 +146,12 @@ class BlogPostViewSetTest(TestCase):
 
 
 class BlogPostFactoryModelTest(TestCase):
-    def setUp(self):
-        self.owner = CustomUserFactory()
-        self.author = AuthorFactory()
-        self.post = BlogPostFactory(owner=self.owner)
-        self.post.authors.add(self.author)
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = CustomUserFactory()
+        cls.author = AuthorFactory()
+        cls.post = BlogPostFactoryBulk(owner=cls.owner)
+        cls.post.authors.add(cls.author)
 
     def test_blogpost_has_valid_owner(self):
         """BlogPost should have an associated owner."""
@@ -166,10 +178,11 @@ class BlogPostFactoryModelTest(TestCase):
 
     def test_blogpost_update_timestamp_changes(self):
         """updated_at should change when post is saved."""
-        old_updated = self.post.updated_at
-        self.post.text = "Updated text"
-        self.post.save()
-        self.assertGreater(self.post.updated_at, old_updated)
+        post = BlogPostFactoryBulk(owner=self.owner)
+        old_updated = post.updated_at
+        post.text = "Updated text"
+        post.save()
+        self.assertGreater(post.updated_at, old_updated)
 
     def test_blogpost_category_field_is_valid_choice(self):
         """Category should be within defined choices."""
@@ -178,7 +191,7 @@ class BlogPostFactoryModelTest(TestCase):
 
     def test_blogpost_default_order_is_zero(self):
         """Default order field should be 0 unless overridden."""
-        post = BlogPostFactory(order=0)
+        post = BlogPostFactoryBulk(order=0)
         self.assertEqual(post.order, 0)
 
     def test_blogpost_unique_constraint_validation(self):
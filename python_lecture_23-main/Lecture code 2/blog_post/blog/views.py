@@ -30,7 +30,7 @@ from blog.tasks import (
 
 class BlogPostListViewSet(mixins.ListModelMixin,
                          viewsets.GenericViewSet):
-    queryset = BlogPost.objects.filter(deleted=False)
+    queryset = BlogPost.objects.filter(deleted=False).prefetch_related('authors')
     serializer_class = BlogPostListSerializer
     pagination_class = BlogPostPagination
     filterset_class = BlogPostFilter
@@ -39,7 +39,7 @@ class BlogPostListViewSet(mixins.ListModelMixin,
 
 class BlogPostDetailViewSet(mixins.RetrieveModelMixin,
                             viewsets.GenericViewSet):
-    queryset = BlogPost.objects.filter(deleted=False)
+    queryset = BlogPost.objects.filter(deleted=False).prefetch_related('authors')
     serializer_class = BlogPostDetailSerializer
 
 
@@ -62,7 +62,7 @@ class  BlogPostDeleteViewSet(mixins.DestroyModelMixin,
 
 
 class BlogPostViewSet(ModelViewSet):
-    queryset = BlogPost.objects.filter(deleted=False)
+    queryset = BlogPost.objects.filter(deleted=False).select_related('owner').prefetch_related('authors')
     filterset_class = BlogPostFilter
     # permission_classes = [IsAuthenticated, ReadOnlyOrIsOwnerOrAdmin]
 
@@ -129,13 +129,13 @@ class BlogPostViewSet(ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def archived_posts(self, request):
-        archived_posts = BlogPost.objects.filter(archived=True)
+        archived_posts = BlogPost.objects.filter(archived=True).prefetch_related('authors')
         serializer = self.get_serializer(archived_posts, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=['get'])
     def published_posts(self, request):
-        published_posts = BlogPost.objects.filter(published=True)
+        published_posts = BlogPost.objects.filter(published=True).prefetch_related('authors')
         serializer = self.get_serializer(published_posts, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
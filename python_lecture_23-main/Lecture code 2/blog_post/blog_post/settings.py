@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 import os
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -79,6 +80,12 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Fail the test run when a request triggers an N+1 query
+TEST = 'test' in sys.argv
+if TEST:
+    INSTALLED_APPS += ['zeal']
+    MIDDLEWARE += ['zeal.middleware.zeal_middleware']
+
 ROOT_URLCONF = 'blog_post.urls'
 
 TEMPLATES = [